@@ -355,7 +355,8 @@ class ConvertAZFP(ConvertBase):
                                 ).replace(tzinfo=timezone.utc).timestamp())
         return ping_time
 
-    def save(self, file_format, save_path=None, combine_opt=False, overwrite=False, compress=True):
+    def save(self, file_format, save_path=None, combine_opt=False, overwrite=False, compress=True,
+             parallel=False):
         """Save data from raw 01A format to a netCDF4 or Zarr file
 
         Parameters
@@ -373,6 +374,9 @@ class ConvertAZFP(ConvertBase):
             Whether or not to overwrite the file if the output path already exists.
         compress : bool
             Whether or not to compress backscatter data. Defaults to `True`
+        parallel : bool
+            Not used for AZFP, whose files are always converted one after another.
+            Accepted for consistency with the other sonar models.
         """
 
         # Subfunctions to set various dictionaries
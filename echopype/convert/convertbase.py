@@ -126,7 +126,7 @@ class ConvertBase:
             self.nc_path = self.nc_path[0]
             self.zarr_path = self.zarr_path[0]
 
-    def raw2nc(self, save_path=None, combine_opt=False, overwrite=False, compress=True):
+    def raw2nc(self, save_path=None, combine_opt=False, overwrite=False, compress=True, parallel=False):
         """Wrapper for saving to netCDF.
 
         Parameters
@@ -142,10 +142,13 @@ class ConvertBase:
             Whether or not to overwrite the file if the output path already exists.
         compress : bool
             Whether or not to compress backscatter data. Defaults to `True`
+        parallel : bool
+            Whether or not to convert multiple files in separate processes when not combining them.
+            Defaults to `False`
         """
-        self.save(".nc", save_path, combine_opt, overwrite, compress)
+        self.save(".nc", save_path, combine_opt, overwrite, compress, parallel)
 
-    def raw2zarr(self, save_path=None, combine_opt=False, overwrite=False, compress=True):
+    def raw2zarr(self, save_path=None, combine_opt=False, overwrite=False, compress=True, parallel=False):
         """Wrapper for saving to zarr.
 
         Parameters
@@ -161,10 +164,13 @@ class ConvertBase:
             Whether or not to overwrite the file if the output path already exists.
         compress : bool
             Whether or not to compress backscatter data. Defaults to `True`
+        parallel : bool
+            Whether or not to convert multiple files in separate processes when not combining them.
+            Defaults to `False`
         """
-        self.save(".zarr", save_path, combine_opt, overwrite, compress)
+        self.save(".zarr", save_path, combine_opt, overwrite, compress, parallel)
 
-    def save(self, param, save_path, combine_opt, overwrite, compress):
+    def save(self, param, save_path, combine_opt, overwrite, compress, parallel):
         """Wrapper for saving functions.
         """
         pass
@@ -5,13 +5,14 @@ Functions to unpack Simrad EK60 .raw data file and save to .nc.
 
 import os
 import shutil
-from collections import defaultdict
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from datetime import datetime as dt
 import pytz
-import pynmea2
 
 from echopype.convert.utils.ek60_raw_io import RawSimradFile, SimradEOF
+from echopype.convert.utils.ek60_date_conversion import nt_to_unix_ms
 from echopype.convert.utils.nmea_data import NMEAData
 from echopype.convert.utils.set_groups import SetGroups
 from echopype._version import get_versions
@@ -26,6 +27,53 @@ INDEX2POWER = (10.0 * np.log10(2.0) / 256.0)
 # Create a constant to convert from indexed angles to electrical angles.
 INDEX2ELEC = 180.0 / 128.0
 
+# Per-ping metadata stored as float32 for each channel, these are all 4-byte floats in the RAW datagram
+PING_DATA_FLOAT_FIELDS = ('transducer_depth', 'transmit_power', 'pulse_length', 'bandwidth', 'sample_interval',
+                          'sound_velocity', 'absorption_coefficient', 'heave', 'roll', 'pitch', 'temperature',
+                          'heading')
+
+
+def _stack_pings(pings, out):
+    """Stack the pings of one channel into a preallocated array.
+
+    Parameters
+    ----------
+    pings : list
+        arrays of power or angle data, one per ping, all with the same number of samples
+    out : np.ndarray
+        output array of dimension [ping_time x range_bin (x 2)], samples beyond the
+        length of the pings are left untouched
+    """
+    np.stack(pings, out=out[:, :pings[0].shape[0]])
+
+
+def _all_equal(values):
+    """Check whether all values in a sequence are identical, stopping at the first difference."""
+    return all(v == values[0] for v in values)
+
+
+def _convert_one(filename, file_format, save_path, overwrite, compress, platform):
+    """Convert a single EK60 ``.raw`` file, used to run conversions in worker processes.
+
+    Parameters
+    ----------
+    filename : str
+        path to the ``.raw`` file
+    file_format : str
+        format of output file. ".nc" for netCDF4 or ".zarr" for Zarr
+    save_path : str
+        directory to save output to, or `None` to save in the same location as the raw file
+    overwrite : bool
+        whether or not to overwrite the file if the output path already exists
+    compress : bool
+        whether or not to compress backscatter data
+    platform : dict
+        platform name, type and ICES code set by the user on the parent converter
+    """
+    tmp = ConvertEK60(filename)
+    tmp._platform = platform
+    tmp.save(file_format, save_path, combine_opt=False, overwrite=overwrite, compress=compress)
+
 
 class ConvertEK60(ConvertBase):
     """Class for converting EK60 .raw files."""
@@ -39,8 +87,9 @@ class ConvertEK60(ConvertBase):
         self.ping_data_dict = {}   # dictionary to store metadata
         self.power_dict = {}   # dictionary to store power data
         self.angle_dict = {}   # dictionary to store angle data
-        self.ping_time = []    # list to store ping time
+        self.ping_time = array('q')    # array to store ping time as milliseconds since 1970-01-01
         self.CON1_datagram = None    # storage for CON1 datagram for ME70
+        self._ch_storage = []        # per-channel storage targets used when appending pings
 
         # Variables only used in EK60 parsing
         self.range_lengths = None    # number of range_bin groups
@@ -60,19 +109,41 @@ class ConvertEK60(ConvertBase):
         datagram : dict
             the newly read datagram of type 'RAW'
         """
-        self.ping_data_dict[ch_num]['mode'].append(datagram['mode'])
-        self.ping_data_dict[ch_num]['transducer_depth'].append(datagram['transducer_depth'])
-        self.ping_data_dict[ch_num]['transmit_power'].append(datagram['transmit_power'])
-        self.ping_data_dict[ch_num]['pulse_length'].append(datagram['pulse_length'])
-        self.ping_data_dict[ch_num]['bandwidth'].append(datagram['bandwidth'])
-        self.ping_data_dict[ch_num]['sample_interval'].append(datagram['sample_interval'])
-        self.ping_data_dict[ch_num]['sound_velocity'].append(datagram['sound_velocity'])
-        self.ping_data_dict[ch_num]['absorption_coefficient'].append(datagram['absorption_coefficient'])
-        self.ping_data_dict[ch_num]['heave'].append(datagram['heave'])
-        self.ping_data_dict[ch_num]['roll'].append(datagram['roll'])
-        self.ping_data_dict[ch_num]['pitch'].append(datagram['pitch'])
-        self.ping_data_dict[ch_num]['temperature'].append(datagram['temperature'])
-        self.ping_data_dict[ch_num]['heading'].append(datagram['heading'])
+        ping_data = self.ping_data_dict[ch_num]
+        ping_data['mode'].append(datagram['mode'])
+        ping_data['transducer_depth'].append(datagram['transducer_depth'])
+        ping_data['transmit_power'].append(datagram['transmit_power'])
+        ping_data['pulse_length'].append(datagram['pulse_length'])
+        ping_data['bandwidth'].append(datagram['bandwidth'])
+        ping_data['sample_interval'].append(datagram['sample_interval'])
+        ping_data['sound_velocity'].append(datagram['sound_velocity'])
+        ping_data['absorption_coefficient'].append(datagram['absorption_coefficient'])
+        ping_data['heave'].append(datagram['heave'])
+        ping_data['roll'].append(datagram['roll'])
+        ping_data['pitch'].append(datagram['pitch'])
+        ping_data['temperature'].append(datagram['temperature'])
+        ping_data['heading'].append(datagram['heading'])
+
+    def _append_ping(self, ping_datagrams):
+        """Store the datagrams of one ping once data from all channels are present.
+
+        Parameters
+        ----------
+        ping_datagrams : list
+            datagrams of type 'RAW' from the same ping, ordered by channel number
+        """
+        # append ping time from first channel
+        self.ping_time.append(nt_to_unix_ms((ping_datagrams[0]['low_date'], ping_datagrams[0]['high_date'])))
+
+        for (ch_num, freq, append_power, append_angle), datagram in zip(self._ch_storage, ping_datagrams):
+            # If frequency matches for this channel, actually store data
+            if freq == datagram['frequency']:
+                self._append_channel_ping_data(ch_num, datagram)  # ping-by-ping metadata
+                append_power(datagram['power'])  # append power data
+                append_angle(datagram['angle'])  # append angle data
+            else:
+                # TODO: need error-handling code here
+                print('Frequency mismatch for data from the same channel number!')
 
     def _read_datagrams(self, fid):
         """
@@ -93,19 +164,24 @@ class ConvertEK60(ConvertBase):
         tmp_datagram_dict = []  # tmp list of datagrams, only saved to actual output
                                 # structure if data from all freq channels are present
 
+        # Bind methods used for every datagram to local names to avoid repeated attribute lookups
+        read_datagram = fid.read
+        add_nmea_datagram = self.nmea_data.add_datagram
+        tx_num = self.config_datagram['transceiver_count']  # number of transceivers
+
         while True:
             try:
-                new_datagram = fid.read(1)
+                new_datagram = read_datagram(1)
             except SimradEOF:
                 break
 
-            # Convert the timestamp to a datetime64 object.
-            new_datagram['timestamp'] = np.datetime64(new_datagram['timestamp'].replace(tzinfo=None), '[ms]')
-
             num_datagrams_parsed += 1
 
+            # Classify the datagram once by the first 3 characters of its type
+            dgram_type = new_datagram['type'][:3]
+
             # RAW datagrams store raw acoustic data for a channel
-            if new_datagram['type'].startswith('RAW'):
+            if dgram_type == 'RAW':
                 curr_ch_num = new_datagram['channel']
 
                 # Reset counter and storage for parsed number of channels
@@ -119,42 +195,29 @@ class ConvertEK60(ConvertBase):
                 tmp_datagram_dict.append(new_datagram)
 
                 # Actually save datagram when all freq channels are present
-                if np.all(np.array([curr_ch_num, tmp_num_ch_per_ping_parsed])
-                          == self.config_datagram['transceiver_count']):
-
-                    # append ping time from first channel
-                    self.ping_time.append(tmp_datagram_dict[0]['timestamp'])
-
-                    for ch_seq in range(self.config_datagram['transceiver_count']):
-                        # If frequency matches for this channel, actually store data
-                        # Note all storage structure indices are 1-based since they are indexed by
-                        # the channel number as stored in config_datagram['transceivers'].keys()
-                        if self.config_datagram['transceivers'][ch_seq+1]['frequency'] \
-                                == tmp_datagram_dict[ch_seq]['frequency']:
-                            self._append_channel_ping_data(ch_seq+1, tmp_datagram_dict[ch_seq])  # ping-by-ping metadata
-                            self.power_dict[ch_seq+1].append(tmp_datagram_dict[ch_seq]['power'])  # append power data
-                            self.angle_dict[ch_seq+1].append(tmp_datagram_dict[ch_seq]['angle'])  # append angle data
-                        else:
-                            # TODO: need error-handling code here
-                            print('Frequency mismatch for data from the same channel number!')
+                if curr_ch_num == tx_num and tmp_num_ch_per_ping_parsed == tx_num:
+                    self._append_ping(tmp_datagram_dict)
 
             # NME datagrams store ancillary data as NMEA-0817 style ASCII data.
-            elif new_datagram['type'].startswith('NME'):
+            elif dgram_type == 'NME':
                 # Add the datagram to our nmea_data object.
-                self.nmea_data.add_datagram(new_datagram['timestamp'],
-                                            new_datagram['nmea_string'])
+                # The timestamp is converted to a datetime64 object only for datagrams that are stored,
+                # for RAW datagrams this is done in self._append_ping()
+                add_nmea_datagram(np.datetime64(nt_to_unix_ms((new_datagram['low_date'],
+                                                               new_datagram['high_date'])), 'ms'),
+                                  new_datagram['nmea_string'])
 
             # TAG datagrams contain time-stamped annotations inserted via the recording software
-            elif new_datagram['type'].startswith('TAG'):
+            elif dgram_type == 'TAG':
                 print('TAG datagram encountered.')
 
             # BOT datagrams contain sounder detected bottom depths from .bot files
-            elif new_datagram['type'].startswith('BOT'):
+            elif dgram_type == 'BOT':
                 print('BOT datagram encountered.')
 
             # DEP datagrams contain sounder detected bottom depths from .out files
             # as well as reflectivity data
-            elif new_datagram['type'].startswith('DEP'):
+            elif dgram_type == 'DEP':
                 print('DEP datagram encountered.')
 
             else:
@@ -174,55 +237,48 @@ class ConvertEK60(ConvertBase):
         uni_cnt_insert = np.cumsum(np.insert(uni_cnt, 0, 0))
         beam_type = np.array([x['beam_type'] for x in self.config_datagram['transceivers'].values()])
         for range_group in range(len(uni)):
-            self.ping_time_split[range_group] = np.array(self.ping_time)[uni_cnt_insert[range_group]:
-                                                                         uni_cnt_insert[range_group+1]]
+            self.ping_time_split[range_group] = self.ping_time[uni_cnt_insert[range_group]:
+                                                               uni_cnt_insert[range_group+1]]
             range_bin_freq_lens = np.unique(
                 [x_val[uni_cnt_insert[range_group]].shape for x_val in self.power_dict.values()])
             self.angle_dict_split[range_group] = np.empty(
                 (len(self.power_dict), uni_cnt_insert[range_group + 1] - uni_cnt_insert[range_group],
                  range_bin_freq_lens.max(), 2))
             self.angle_dict_split[range_group][:] = np.nan
-            if len(range_bin_freq_lens) != 1:  # different frequency channels have different range_bin lengths
-                tmp_power_pad, tmp_angle_pad = [], []
-                for x_p, x_a in zip(self.power_dict.values(), self.angle_dict.values()):  # pad nan to shorter channels
-                    tmp_p_data = np.array(x_p[uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]])
-                    tmp_a_data = np.array(x_a[uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]])
-                    tmp_power = np.pad(tmp_p_data.astype('float64'),
-                                       ((0, 0), (0, range_bin_freq_lens.max()-tmp_p_data.shape[1])),
-                                       mode='constant', constant_values=(np.nan,))
-                    tmp_angle = np.pad(tmp_a_data.astype('float64'),
-                                       ((0, 0), (0, range_bin_freq_lens.max()-tmp_a_data.shape[1]), (0, 0)),
-                                       mode='constant', constant_values=(np.nan,))
-                    tmp_power_pad.append(tmp_power)
-                    tmp_angle_pad.append(tmp_angle)
-                self.angle_dict_split[range_group] = np.array(tmp_angle_pad)
-                self.power_dict_split[range_group] = np.array(tmp_power_pad) * INDEX2POWER
-            else:
-                self.power_dict_split[range_group] = np.array(
-                    [x[uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]]
-                     for x_key, x in self.power_dict.items()]) * INDEX2POWER
-                for ch in np.argwhere(beam_type == 1):   # if split-beam
-                    self.angle_dict_split[range_group][ch, :, :, :] = np.array(
-                        self.angle_dict[ch[0]+1][uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]])
-            self.tx_sig[range_group] = defaultdict(lambda: np.zeros(shape=(tx_num,), dtype='float32'))
-
-        pulse_length, transmit_power, bandwidth, sample_interval = [], [], [], []
-        param = [pulse_length, transmit_power, bandwidth, sample_interval]
+            # Pad with NaN only if different frequency channels have different range_bin lengths
+            self.power_dict_split[range_group] = np.empty(
+                (len(self.power_dict), uni_cnt_insert[range_group + 1] - uni_cnt_insert[range_group],
+                 range_bin_freq_lens.max()))
+            if len(range_bin_freq_lens) != 1:
+                self.power_dict_split[range_group][:] = np.nan
+            # Stack pings of each channel directly into the preallocated output arrays
+            # and convert to power in place to avoid intermediate copies of the full data
+            for ch_seq, x in enumerate(self.power_dict.values()):
+                _stack_pings(x[uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]],
+                             self.power_dict_split[range_group][ch_seq])
+            self.power_dict_split[range_group] *= INDEX2POWER
+            for ch in np.argwhere(beam_type == 1):   # if split-beam
+                _stack_pings(self.angle_dict[ch[0]+1][uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]],
+                             self.angle_dict_split[range_group][ch[0]])
+
         param_name = ['pulse_length', 'transmit_power', 'bandwidth', 'sample_interval']
         param_name_save = ['transmit_duration_nominal', 'transmit_power', 'transmit_bandwidth', 'sample_interval']
-        for range_group in range(len(uni)):
-            for p, pname in zip(param, param_name):
-                p.append(np.array([np.array(
-                    self.ping_data_dict[x][pname][uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]])
-                    for x in self.config_datagram['transceivers'].keys()]))
+        # Convert each parameter to an array of dimension [frequency x ping_time] once for all range groups
+        param = [np.array([self.ping_data_dict[x][pname] for x in self.config_datagram['transceivers'].keys()],
+                          dtype='float32')
+                 for pname in param_name]
         tx_num = self.config_datagram['transceiver_count']  # number of transceivers
         for range_group in range(len(uni)):
+            # One zero-initialized [parameter x frequency] buffer per range group, exposed as named rows
+            self.tx_sig[range_group] = dict(zip(param_name_save,
+                                                np.zeros((len(param_name_save), tx_num), dtype='float32')))
             for p, pname, pname_save in zip(param, param_name, param_name_save):
-                if np.unique(p[range_group], axis=1).size != tx_num:
+                p_uni = np.unique(p[:, uni_cnt_insert[range_group]:uni_cnt_insert[range_group + 1]], axis=1)
+                if p_uni.size != tx_num:
                     # TODO: right now set_groups_ek60/set_beam doens't deal with this case, need to add
                     ValueError('%s changed in the middle of range_bin group' % pname)
                 else:
-                    self.tx_sig[range_group][pname_save] = np.unique(p[range_group], axis=1).squeeze(axis=1)
+                    self.tx_sig[range_group][pname_save][:] = p_uni.squeeze(axis=1)
 
         self.range_lengths = uni  # used in looping when saving files with different range_bin numbers
 
@@ -248,11 +304,20 @@ class ConvertEK60(ConvertBase):
                         self.config_datagram['timestamp'].replace(tzinfo=None), '[ms]')
 
                     for ch_num in self.config_datagram['transceivers'].keys():
-                        self.ping_data_dict[ch_num] = defaultdict(list)
+                        # Typed arrays hold the per-ping metadata compactly instead of lists of Python objects
+                        self.ping_data_dict[ch_num] = {k: array('f') for k in PING_DATA_FLOAT_FIELDS}
+                        self.ping_data_dict[ch_num]['mode'] = array('h')
                         self.ping_data_dict[ch_num]['frequency'] = \
                             self.config_datagram['transceivers'][ch_num]['frequency']
                         self.power_dict[ch_num] = []
                         self.angle_dict[ch_num] = []
+
+                    # Resolve the storage of each channel once instead of for every ping.
+                    # Note all storage structure indices are 1-based since they are indexed by
+                    # the channel number as stored in config_datagram['transceivers'].keys()
+                    self._ch_storage = [(ch_num, ch['frequency'],
+                                         self.power_dict[ch_num].append, self.angle_dict[ch_num].append)
+                                        for ch_num, ch in self.config_datagram['transceivers'].items()]
                 else:
                     tmp_config = fid.read(1)
 
@@ -266,13 +331,17 @@ class ConvertEK60(ConvertBase):
                 # Read the rest of datagrams
                 self._read_datagrams(fid)
 
+        # Wrap the ping times in a datetime64 array without copying
+        self.ping_time = np.frombuffer(self.ping_time, dtype='int64').view('datetime64[ms]')
+
         # Split data based on range_group (when there is a switch of range_bin in the middle of a file)
         self.split_by_range_group()
 
         # Trim excess data from NMEA object
         self.nmea_data.trim()
 
-    def save(self, file_format, save_path=None, combine_opt=False, overwrite=False, compress=True):
+    def save(self, file_format, save_path=None, combine_opt=False, overwrite=False, compress=True,
+             parallel=False):
         """Save data from .raw format to a netCDF4 or Zarr file
 
         Parameters
@@ -290,6 +359,10 @@ class ConvertEK60(ConvertBase):
             Whether or not to overwrite the file if the output path already exists.
         compress : bool
             Whether or not to compress backscatter data. Defaults to `True`
+        parallel : bool
+            Whether or not to convert multiple files in separate processes when not combining them.
+            Scripts using this on platforms that spawn processes (macOS, Windows) need an
+            ``if __name__ == '__main__':`` guard. Defaults to `False`
         """
         def export(file_idx=None):
             # Subfunctions to set various dictionaries
@@ -334,9 +407,9 @@ class ConvertEK60(ConvertBase):
                 # Read pitch/roll/heave from ping data
                 # [seconds since 1900-01-01] for xarray.to_netcdf conversion
                 out_dict['ping_time'] = self.ping_time
-                out_dict['pitch'] = np.array(self.ping_data_dict[1]['pitch'], dtype='float32')
-                out_dict['roll'] = np.array(self.ping_data_dict[1]['roll'], dtype='float32')
-                out_dict['heave'] = np.array(self.ping_data_dict[1]['heave'], dtype='float32')
+                out_dict['pitch'] = np.frombuffer(self.ping_data_dict[1]['pitch'], dtype='float32')
+                out_dict['roll'] = np.frombuffer(self.ping_data_dict[1]['roll'], dtype='float32')
+                out_dict['heave'] = np.frombuffer(self.ping_data_dict[1]['heave'], dtype='float32')
                 # water_level is set to 0 for EK60 since this is not separately recorded
                 # and is part of transducer_depth
                 out_dict['water_level'] = np.int32(0)
@@ -344,10 +417,9 @@ class ConvertEK60(ConvertBase):
                 # Read lat/long from NMEA datagram
                 idx_loc = np.argwhere(np.isin(self.nmea_data.messages, ['GGA', 'GLL', 'RMC'])).squeeze()
                 # TODO: use NaN when nmea_msg is empty
-                nmea_msg = []
-                [nmea_msg.append(pynmea2.parse(self.nmea_data.raw_datagrams[x])) for x in idx_loc]
-                out_dict['lat'] = np.array([x.latitude for x in nmea_msg])
-                out_dict['lon'] = np.array([x.longitude for x in nmea_msg])
+                # lat/lon were already parsed from these datagrams when added to nmea_data
+                out_dict['lat'] = self.nmea_data.latitudes[idx_loc]
+                out_dict['lon'] = self.nmea_data.longitudes[idx_loc]
                 out_dict['location_time'] = self.nmea_data.nmea_times[idx_loc]
 
                 if len(self.range_lengths) > 1:
@@ -398,9 +470,13 @@ class ConvertEK60(ConvertBase):
                             "channel_id": "channel_id",
                             "beam_type": "beam_type"}
 
-                for encode_name, origin_name in param_numerical.items():
-                    beam_dict[encode_name] = np.array(
-                        [val[origin_name] for key, val in self.config_datagram['transceivers'].items()]).astype('float32')
+                # Extract all numerical parameters in a single [parameter x frequency] float32 array
+                # and store each parameter as a view of its row
+                config_numerical = np.array(
+                    [[val[origin_name] for val in self.config_datagram['transceivers'].values()]
+                     for origin_name in param_numerical.values()], dtype='float32')
+                for encode_name, row in zip(param_numerical.keys(), config_numerical):
+                    beam_dict[encode_name] = row
                 beam_dict['transducer_offset_z'] += [self.ping_data_dict[x]['transducer_depth'][0]
                                                     for x in self.config_datagram['transceivers'].keys()]
 
@@ -480,10 +556,9 @@ class ConvertEK60(ConvertBase):
                                 for x in self.config_datagram['transceivers'].keys()], dtype='float32')
 
                 # Extract absorption and sound speed depending on if the values are identical for all pings
-                abs_tmp = np.unique(self.ping_data_dict[1]['absorption_coefficient']).size
-                ss_tmp = np.unique(self.ping_data_dict[1]['sound_velocity']).size
                 # --- if identical for all pings, save only values from the first ping
-                if np.all(np.array([abs_tmp, ss_tmp]) == 1):
+                if _all_equal(self.ping_data_dict[1]['absorption_coefficient']) and \
+                        _all_equal(self.ping_data_dict[1]['sound_velocity']):
                     abs_val = np.array([self.ping_data_dict[x]['absorption_coefficient'][0]
                                         for x in self.config_datagram['transceivers'].keys()], dtype='float32')
                     ss_val = np.array([self.ping_data_dict[x]['sound_velocity'][0]
@@ -513,10 +588,20 @@ class ConvertEK60(ConvertBase):
         self.validate_path(save_path, file_format, combine_opt)
         if len(self.filename) == 1 or combine_opt:
             export()
+        elif parallel:
+            # Files are independent of each other when not combined, so convert them in parallel
+            with ProcessPoolExecutor(max_workers=min(len(self.filename), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(_convert_one, file, file_format, save_path, overwrite, compress,
+                                           self._platform)
+                           for file in self.filename]
+                for future in futures:
+                    future.result()   # re-raise errors from the worker processes
         else:
-            for freq_seq, file in enumerate(self.filename):
-                if freq_seq > 0:
+            for file_seq, file in enumerate(self.filename):
+                if file_seq > 0:
+                    platform = self._platform
                     self.__init__(self.filename)        # Clear previous parse
+                    self._platform = platform
                     self.validate_path(save_path, file_format, combine_opt)
                 self.load_ek60_raw([file])
-                export(freq_seq)
+                export(file_seq)
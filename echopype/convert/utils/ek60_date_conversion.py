@@ -23,8 +23,9 @@ UTC_NT_EPOCH = datetime.datetime(1601, 1, 1, 0, 0, 0, tzinfo=pytz_utc)
 UTC_UNIX_EPOCH = datetime.datetime(1970, 1, 1, 0, 0, 0, tzinfo=pytz_utc)
 
 EPOCH_DELTA_SECONDS = (UTC_UNIX_EPOCH - UTC_NT_EPOCH).total_seconds()
+EPOCH_DELTA_MS = int(EPOCH_DELTA_SECONDS) * 1000
 
-__all__ = ['nt_to_unix', 'unix_to_nt']
+__all__ = ['nt_to_unix', 'nt_to_unix_ms', 'unix_to_nt']
 
 
 def nt_to_unix(nt_timestamp_tuple, return_datetime=True):
@@ -60,6 +61,23 @@ def nt_to_unix(nt_timestamp_tuple, return_datetime=True):
         return sec_past_unix_epoch
 
 
+def nt_to_unix_ms(nt_timestamp_tuple):
+    """
+    :param nt_timestamp_tuple: Tuple of two longs representing the NT date
+    :type nt_timestamp_tuple: (long, long)
+
+    Returns the integer number of milliseconds since the Unix epoch
+    calculated from the nt time tuple, truncated towards the past.
+    Integer arithmetic is used throughout, so no precision is lost
+    to floating point and no datetime object is created.
+
+    >>> nt_to_unix_ms((19496896, 30196149))
+    1324673643964
+    """
+    lowDateTime, highDateTime = nt_timestamp_tuple
+    return ((highDateTime << 32) + lowDateTime) // 10000 - EPOCH_DELTA_MS
+
+
 def unix_to_nt(unix_timestamp):
     """
     Given a date, return the 2-element tuple used for timekeeping with SIMRAD echosounders
@@ -79,6 +79,9 @@ class RawSimradFile(BufferedReader):
                       'BOT': parsers.SimradBottomParser(),
                       'DEP': parsers.SimradDepthParser()}
 
+    #: Same parsers keyed by the datagram header bytes, used to dispatch without decoding
+    DGRAM_TYPE_KEY_BYTES = {k.encode(): v for k, v in DGRAM_TYPE_KEY.items()}
+
     def __init__(self, name, mode='rb', closefd=True, return_raw=False, buffer_size=1024 * 1024):
 
         #  9-28-18 RHT: Changed RawSimradFile to implement BufferedReader instead of
@@ -273,10 +276,8 @@ class RawSimradFile(BufferedReader):
         Returns a formated datagram object using the data in raw_datagram_string
         '''
 
-        dgram_type = raw_datagram_string[:3].decode()
-        try:
-            parser = self.DGRAM_TYPE_KEY[dgram_type]
-        except KeyError:
+        parser = self.DGRAM_TYPE_KEY_BYTES.get(raw_datagram_string[:3])
+        if parser is None:
             # raise KeyError('Unknown datagram type %s, valid types: %s' % (str(dgram_type), str(self.DGRAM_TYPE_KEY.keys())))
             return raw_datagram_string
 
@@ -380,7 +381,7 @@ class RawSimradFile(BufferedReader):
         old_file_pos = self._tell_bytes()
         log.warning('Attempting to find next valid datagram...')
 
-        while self.peek()['type'][:3] not in list(self.DGRAM_TYPE_KEY.keys()):
+        while self.peek()['type'][:3] not in self.DGRAM_TYPE_KEY:
             self._seek_bytes(1, 1)
 
         log.warning('Found next datagram:  %s', self.peek())
@@ -35,9 +35,17 @@ class _SimradDatagramParser(object):
         self._headers = header_formats
         self._versions    = list(header_formats.keys())
 
+        #  Precompile the fixed-layout header structs so that they are not
+        #  rebuilt from the format strings for every datagram.
+        self._header_structs = dict((v, struct.Struct(self.header_fmt(v))) for v in self._versions)
+        self._header_field_names = dict((v, self.header_fields(v)) for v in self._versions)
+
     def header_fmt(self, version=0):
         return '=' + ''.join([x[1] for x in self._headers[version]])
 
+    def header_struct(self, version=0):
+        return self._header_structs[version]
+
     def header_size(self, version=0):
         return struct.calcsize(self.header_fmt(version))
 
@@ -361,7 +369,6 @@ class SimradNMEAParser(_SimradDatagramParser):
         type:         string == 'NME0'
         low_date:     long uint representing LSBytes of 64bit NT date
         high_date:    long uint representing MSBytes of 64bit NT date
-        timestamp:     datetime.datetime object of NT date, assumed to be UTC
 
         nmea_string:  full (original) NMEA string
 
@@ -404,8 +411,6 @@ class SimradNMEAParser(_SimradDatagramParser):
             if isinstance(data[field], bytes):
                 data[field] = data[field].decode()
 
-        data['timestamp'] = nt_to_unix((data['low_date'], data['high_date']))
-
         if version == 0:
             if (sys.version_info.major > 2):
                 data['nmea_string'] = str(raw_string[self.header_size(version):].strip(b'\x00'), 'ascii', errors='replace')
@@ -841,7 +846,6 @@ class SimradRawParser(_SimradDatagramParser):
         type:         string == 'RAW0'
         low_date:     long uint representing LSBytes of 64bit NT date
         high_date:    long uint representing MSBytes of 64bit NT date
-        timestamp:    datetime.datetime object of NT date, assumed to be UTC
 
         channel                         [short] Channel number
         mode                            [short] 1 = Power only, 2 = Angle only 3 = Power & Angle
@@ -902,21 +906,20 @@ class SimradRawParser(_SimradDatagramParser):
 
     def _unpack_contents(self, raw_string, version):
 
-        header_values = struct.unpack(self.header_fmt(version), raw_string[:self.header_size(version)])
+        header_struct = self.header_struct(version)
+        header_values = header_struct.unpack_from(raw_string)
 
         data = {}
 
         if version == 0:
-            for indx, field in enumerate(self.header_fields(version)):
-                data[field] = header_values[indx]
-                if isinstance(data[field], bytes):
-                    data[field] = data[field].decode()
-
-            data['timestamp'] = nt_to_unix((data['low_date'], data['high_date']))
+            data.update(zip(self._header_field_names[version], header_values))
+            #  'type' and 'spare0' are the only char fields in the header
+            data['type'] = data['type'].decode()
+            data['spare0'] = data['spare0'].decode()
 
             if data['count'] > 0:
                 block_size = data['count'] * 2
-                indx = self.header_size(version)
+                indx = header_struct.size
 
                 if int(data['mode']) & 0x1:
                     data['power'] = np.frombuffer(raw_string[indx:indx + block_size], dtype='int16')
@@ -14,6 +14,16 @@ TODO: fix docstring
 
 
 import numpy as np
+import pynmea2
+
+# Indices of the latitude, N/S, longitude and E/W fields in the comma
+# separated fields of the position datagrams parsed in NMEAData.add_datagram
+POSITION_FIELDS = {'GGA': slice(2, 6),
+                   'GLL': slice(1, 5),
+                   'RMC': slice(3, 7)}
+
+# Maximum number of parsed positions kept in NMEAData._position_cache
+POSITION_CACHE_SIZE = 4096
 
 class NMEAData(object):
     """The nmea_data class provides storage for and parsing of NMEA data commonly
@@ -35,6 +45,17 @@ class NMEAData(object):
         self.talkers = np.empty(self.CHUNK_SIZE, dtype='U2')
         self.messages = np.empty(self.CHUNK_SIZE, dtype='U3')
 
+        # Create arrays to store the position of GGA, GLL and RMC datagrams,
+        # which are parsed once when added. Other datagrams are set to NaN.
+        self.latitudes = np.empty(self.CHUNK_SIZE, dtype='float64')
+        self.longitudes = np.empty(self.CHUNK_SIZE, dtype='float64')
+
+        # Cache of parsed (latitude, longitude) keyed by message ID and the
+        # position fields of the datagram. Timestamps differ between
+        # datagrams but positions repeat when the platform is slow or
+        # stationary, so most position datagrams are not parsed again.
+        self._position_cache = {}
+
         # Create a couple of lists to store the unique talkers and message IDs.
         self.talker_ids = []
         self.message_ids = []
@@ -82,7 +103,9 @@ class NMEAData(object):
 
         add_datagram adds a NMEA datagram to the class. It adds it to the
         raw_datagram list as well as parsing the header and adding the
-        talker + mesage ID to the type_index dictionary.
+        talker + mesage ID to the type_index dictionary. Position datagrams
+        (GGA, GLL and RMC) are parsed here so that latitude and longitude
+        are only extracted once.
         Args:
             time (datetime64): Timestamp of NMEA datagram (this is likely
                 different than the timestamp within the NMEA string itself).
@@ -125,12 +148,42 @@ class NMEAData(object):
             self.nmea_times[self.n_raw-1] = time
             self.talkers[self.n_raw-1] = header[0:2]
             self.messages[self.n_raw-1] = header[2:6]
+            if header[2:5] in POSITION_FIELDS:
+                self.latitudes[self.n_raw-1], self.longitudes[self.n_raw-1] = \
+                    self._parse_position(header[2:5], text)
+            else:
+                self.latitudes[self.n_raw-1] = np.nan
+                self.longitudes[self.n_raw-1] = np.nan
 
             if not header[0:2] in self.talker_ids:
                 self.talker_ids.append(header[0:2])
             if not header[2:5] in self.message_ids:
                 self.message_ids.append(header[2:5])
 
+    def _parse_position(self, message_id, text):
+        """
+        Return the latitude and longitude of a GGA, GLL or RMC datagram.
+
+        Positions are cached by message ID and the raw latitude and longitude
+        fields, so pynmea2 only parses datagrams with a new position. The
+        cache is cleared when it reaches POSITION_CACHE_SIZE entries.
+
+        Args:
+            message_id (str): The NMEA message ID, one of 'GGA', 'GLL' or 'RMC'.
+            text (str): The raw NMEA string.
+
+        Returns:
+            A (latitude, longitude) tuple in decimal degrees.
+        """
+        key = (message_id, tuple(text.split(',')[POSITION_FIELDS[message_id]]))
+        position = self._position_cache.get(key)
+        if position is None:
+            if len(self._position_cache) >= POSITION_CACHE_SIZE:
+                self._position_cache.clear()
+            nmea_msg = pynmea2.parse(text)
+            position = self._position_cache[key] = (nmea_msg.latitude, nmea_msg.longitude)
+        return position
+
     def _resize_arrays(self, new_size):
         """
         Resize arrays if needed to hold more data.
@@ -148,6 +201,8 @@ class NMEAData(object):
         self.raw_datagrams = np.resize(self.raw_datagrams,(new_size))
         self.talkers = np.resize(self.talkers,(new_size))
         self.messages = np.resize(self.messages,(new_size))
+        self.latitudes = np.resize(self.latitudes,(new_size))
+        self.longitudes = np.resize(self.longitudes,(new_size))
 
     def trim(self):
         """
@@ -5,6 +5,9 @@ import numpy as np
 import shutil
 import zarr
 
+# Number of pings in each chunk of backscatter data when saving to zarr
+ZARR_PING_CHUNK_SIZE = 1024
+
 
 class SetGroupsEK60(SetGroupsBase):
     """Class for setting groups in netCDF file for EK60 data.
@@ -268,10 +271,13 @@ class SetGroupsEK60(SetGroupsBase):
             ds['sa_correction'] = ('frequency', beam_dict['sa_correction'])
 
             n_settings = {}
-            z_settings = {}
+            # Chunk backscatter by frequency and blocks of pings in zarr so that chunks can be
+            # compressed independently by the multi-threaded Blosc compressor and read back per frequency
+            z_settings = {'backscatter_r': {'chunks': (1, min(ZARR_PING_CHUNK_SIZE, ds.ping_time.size),
+                                                       ds.range_bin.size)}}
             if self.compress:
                 n_settings = {'backscatter_r': {'zlib': True, 'complevel': 4}}
-                z_settings = {'backscatter_r': {'compressor': zarr.Blosc(cname='zstd', clevel=3, shuffle=2)}}
+                z_settings['backscatter_r']['compressor'] = zarr.Blosc(cname='zstd', clevel=3, shuffle=2)
 
             # save to file
             if self.format == '.nc':
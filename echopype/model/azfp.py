@@ -15,23 +15,36 @@ class ModelAZFP(ModelBase):
 
     def __init__(self, file_path="", salinity=29.6, pressure=60, temperature=None):
         ModelBase.__init__(self, file_path)
+        self._transmit_duration = None   # transmit duration in [seconds] for each frequency
         self._salinity = salinity    # salinity in [psu]
         self._pressure = pressure    # pressure in [dbars] (approximately equal to depth in meters)
         if temperature is None:
-            with xr.open_dataset(self.file_path, group='Environment') as ds_env:
-                print("Initialize using average temperature recorded by instrument")
-                self._temperature = np.nanmean(ds_env.temperature)   # temperature in [Celsius]
+            print("Initialize using average temperature recorded by instrument")
+            self._temperature = np.nanmean(self._open_group('Environment').temperature)   # temperature in [Celsius]
         else:
             self._temperature = temperature
 
         # Initialize environment-related parameters
         self._sound_speed = self.calc_sound_speed()
-        self._sample_thickness = self.calc_sample_thickness()
         self._range = self.calc_range()
         self._seawater_absorption = self.calc_seawater_absorption()
 
         self._tilt_angle = None      # instrument tilt angle in [degrees]
 
+    def close(self):
+        """Closes the netCDF groups opened by this instance and drops values read from them.
+        """
+        ModelBase.close(self)
+        self._transmit_duration = None
+
+    def _get_transmit_duration(self):
+        """Gets the nominal transmit duration of each frequency as a float64 array, read from file once.
+        """
+        if self._transmit_duration is None:
+            self._transmit_duration = \
+                self._open_group('Beam').transmit_duration_nominal.values.astype(np.float64)
+        return self._transmit_duration
+
     @property
     def tilt_angle(self):
         """Gets the tilt of the echosounder from the .nc file
@@ -41,8 +54,7 @@ class ModelAZFP(ModelBase):
         Tilt of echosounder in degrees
         """
         if self._tilt_angle is None:
-            with xr.open_dataset(self.file_path, group='Beam') as ds_beam:
-                self._tilt_angle = np.rad2deg(np.arccos(ds_beam.cos_tilt_mag.mean().data))
+            self._tilt_angle = np.rad2deg(np.arccos(self._open_group('Beam').cos_tilt_mag.mean().data))
         return self._tilt_angle
 
     def calc_sound_speed(self, src='user'):
@@ -61,14 +73,15 @@ class ModelAZFP(ModelBase):
         -------
         An xarray DataArray containing the sea absorption with coordinate frequency
         """
-        with xr.open_dataset(self.file_path, group='Beam') as ds_beam:
-            freq = ds_beam.frequency.astype(np.int64)  # should already be in unit [Hz]
+        freq = self._open_group('Beam').frequency.astype(np.int64)  # should already be in unit [Hz]
         if src == 'user':
-            return uwa.calc_seawater_absorption(freq,
-                                                temperature=self.temperature,
-                                                salinity=self.salinity,
-                                                pressure=self.pressure,
-                                                formula_source='AZFP')
+            # Compute on the plain frequency array and wrap the result with the frequency coordinate once
+            sea_abs = uwa.calc_seawater_absorption(freq.values,
+                                                   temperature=self.temperature,
+                                                   salinity=self.salinity,
+                                                   pressure=self.pressure,
+                                                   formula_source='AZFP')
+            return xr.DataArray(sea_abs, coords=[freq.frequency])
         else:
             ValueError('For AZFP seawater absorption needs to be calculated '
                        'based on user-input environmental parameters.')
@@ -78,9 +91,7 @@ class ModelAZFP(ModelBase):
 
         This will call ``calc_sound_speed`` since sound speed is `not` part of the raw AZFP .01A data file.
         """
-        with xr.open_dataset(self.file_path, group="Beam") as ds_beam:
-            sth = self.sound_speed * ds_beam.sample_interval / 2
-            return sth
+        return self.sound_speed * self._open_group('Beam').sample_interval / 2
 
     def calc_range(self, tilt_corrected=False):
         """Calculates range in meters using AZFP-supplied formula, instead of from sample_interval directly.
@@ -94,34 +105,50 @@ class ModelAZFP(ModelBase):
         -------
         An xarray DataArray containing the range with coordinate frequency
         """
-        ds_beam = xr.open_dataset(self.file_path, group='Beam')
-        ds_vend = xr.open_dataset(self.file_path, group='Vendor')
+        ds_beam = self._open_group('Beam')
+        ds_vend = self._open_group('Vendor')
 
-        range_samples = ds_vend.number_of_samples_per_average_bin   # WJ: same as "range_samples_per_bin" used to calculate "sample_interval"
-        pulse_length = ds_beam.transmit_duration_nominal   # units: seconds
+        # Per-frequency parameters as column vectors so that they broadcast against range_bin
+        range_samples = ds_vend.number_of_samples_per_average_bin.values[:, np.newaxis]   # WJ: same as "range_samples_per_bin" used to calculate "sample_interval"
+        pulse_length = self._get_transmit_duration()[:, np.newaxis]   # units: seconds
         bins_to_avg = 1   # set to 1 since we want to calculate from raw data
         sound_speed = self.sound_speed
-        dig_rate = ds_vend.digitization_rate
-        lockout_index = ds_vend.lockout_index
+        dig_rate = ds_vend.digitization_rate.values[:, np.newaxis]
+        lockout_index = ds_vend.lockout_index.values[:, np.newaxis]
 
         # Below is from LoadAZFP.m, the output is effectively range_bin+1 when bins_to_avg=1
-        range_mod = xr.DataArray(np.arange(1, len(ds_beam.range_bin) - bins_to_avg + 2, bins_to_avg),
-                                 coords=[('range_bin', ds_beam.range_bin)])
+        range_mod = np.arange(1, len(ds_beam.range_bin) - bins_to_avg + 2, bins_to_avg)
 
-        # Calculate range using parameters for each freq
+        # Calculate range using parameters for each freq on plain arrays and label the result once
         range_meter = (sound_speed * lockout_index / (2 * dig_rate) + sound_speed / 4 *
                        (((2 * range_mod - 1) * range_samples * bins_to_avg - 1) / dig_rate +
                         pulse_length))
+        range_meter = xr.DataArray(range_meter, coords=[('frequency', ds_beam.frequency),
+                                                        ('range_bin', ds_beam.range_bin)])
 
         if tilt_corrected:
             range_meter = ds_beam.cos_tilt_mag.mean() * range_meter
 
-        ds_beam.close()
-        ds_vend.close()
-
         return range_meter
 
-    def calibrate(self, save=False, save_postfix='_Sv', save_path=None):
+    def _calc_gain_terms(self, ds_beam):
+        """Calculates the AZFP calibration terms that only vary with frequency, shared by Sv and TS.
+
+        Parameters
+        ----------
+        ds_beam : xr.Dataset
+            Beam group of the converted AZFP file
+
+        Returns
+        -------
+        The divisor converting backscatter counts to volts, and the sum of the
+        per-frequency gain terms, both as arrays with dimension [frequency]
+        """
+        DS = ds_beam.DS.values
+        freq_term = ds_beam.EL.values - 2.5 / DS - ds_beam.TVR.values - 20 * np.log10(ds_beam.VTX.values)
+        return 26214 * DS, freq_term
+
+    def calibrate(self, save=False, save_postfix='_Sv', save_path=None, dtype='float64', use_cache=False):
         """Perform echo-integration to get volume backscattering strength (Sv) from AZFP power data.
 
         The calibration formula used here is documented in eq.(9) on p.85
@@ -139,26 +166,43 @@ class ModelAZFP(ModelBase):
             Filename postfix, default to '_Sv'
         save_path : str
             Full filename to save to, overwriting the RAWFILE_Sv.nc default
+        dtype : str or np.dtype, optional
+            Data type of calibrated Sv, default to 'float64'.
+            'float32' halves the memory and file size of the output
+        use_cache : bool, optional
+            whether to reuse Sv cached on disk by a previous call with the same .nc file
+            and environmental parameters, and to cache the result otherwise.
+            default to ``False``
         """
         # Print raw data nc file
         print('%s  calibrating data in %s' % (dt.datetime.now().strftime('%H:%M:%S'), self.file_path))
 
-        # Open data set for Environment and Beam groups
-        ds_beam = xr.open_dataset(self.file_path, group="Beam")
-
         range_meter = self.range
-        Sv = (ds_beam.EL - 2.5 / ds_beam.DS + ds_beam.backscatter_r / (26214 * ds_beam.DS) -
-              ds_beam.TVR - 20 * np.log10(ds_beam.VTX) + 20 * np.log10(range_meter) +
-              2 * self.seawater_absorption * range_meter -
-              10 * np.log10(0.5 * self.sound_speed *
-                            ds_beam.transmit_duration_nominal *
-                            ds_beam.equivalent_beam_angle) + ds_beam.Sv_offset)
+        cache_path = None
+        if use_cache:
+            cache_path = self._get_cache_path(save_postfix, self.sound_speed, self.seawater_absorption,
+                                              range_meter, np.dtype(dtype).str)
+
+        if cache_path is not None and os.path.exists(cache_path):
+            with xr.open_dataset(cache_path) as ds_cache:
+                Sv = ds_cache.load()
+        else:
+            ds_beam = self._open_group('Beam')
+            scale, freq_term = self._calc_gain_terms(ds_beam)
+            freq_term += ds_beam.Sv_offset.values - 10 * np.log10(0.5 * self.sound_speed *
+                                                                  self._get_transmit_duration() *
+                                                                  ds_beam.equivalent_beam_angle.values)
+            Sv = self._calc_echo_level(ds_beam.backscatter_r, range_meter.values, tvg_factor=20,
+                                       freq_term=freq_term, scale=scale, dtype=dtype)
 
-        Sv.name = 'Sv'
-        Sv = Sv.to_dataset()
+            Sv.name = 'Sv'
+            Sv = Sv.to_dataset()
 
-        # Attached calculated range into the dataset
-        Sv['range'] = (('frequency', 'range_bin'), self.range)
+            # Attached calculated range into the dataset
+            Sv['range'] = (('frequency', 'range_bin'), range_meter)
+
+            if cache_path is not None:
+                Sv.to_netcdf(path=cache_path, mode="w")
 
         # Save calibrated data into the calling instance and
         #  to a separate .nc file in the same directory as the data filef.Sv = Sv
@@ -168,10 +212,7 @@ class ModelAZFP(ModelBase):
             print("{} saving calibrated Sv to {}".format(dt.datetime.now().strftime('%H:%M:%S'), self.Sv_path))
             self.Sv.to_netcdf(path=self.Sv_path, mode="w")
 
-        # Close opened resources
-        ds_beam.close()
-
-    def calibrate_TS(self, save=False, save_postfix='_TS', save_path=None):
+    def calibrate_TS(self, save=False, save_postfix='_TS', save_path=None, dtype='float64', use_cache=False):
         """Perform echo-integration to get Target Strength (TS) from AZFP power data.
 
         The calibration formula used here is documented in eq.(10) on p.85
@@ -186,13 +227,31 @@ class ModelAZFP(ModelBase):
             Filename postfix, default to '_TS'
         save_path : str, optional
             Full filename to save the TS calculation results, overwritting the RAWFILE_TS.nc default
+        dtype : str or np.dtype, optional
+            Data type of calibrated TS, default to 'float64'.
+            'float32' halves the memory and file size of the output
+        use_cache : bool, optional
+            whether to reuse TS cached on disk by a previous call with the same .nc file
+            and environmental parameters, and to cache the result otherwise.
+            default to ``False``
         """
-        with xr.open_dataset(self.file_path, group="Beam") as ds_beam:
-            self.TS = (ds_beam.EL - 2.5 / ds_beam.DS + ds_beam.backscatter_r / (26214 * ds_beam.DS) -
-                       ds_beam.TVR - 20 * np.log10(ds_beam.VTX) + 40 * np.log10(self.range) +
-                       2 * self.seawater_absorption * self.range)
+        cache_path = None
+        if use_cache:
+            cache_path = self._get_cache_path(save_postfix, self.seawater_absorption,
+                                              self.range, np.dtype(dtype).str)
+
+        if cache_path is not None and os.path.exists(cache_path):
+            with xr.open_dataarray(cache_path) as da_cache:
+                self.TS = da_cache.load()
+        else:
+            ds_beam = self._open_group('Beam')
+            scale, freq_term = self._calc_gain_terms(ds_beam)
+            self.TS = self._calc_echo_level(ds_beam.backscatter_r, self.range.values, tvg_factor=40,
+                                            freq_term=freq_term, scale=scale, dtype=dtype)
             self.TS.name = "TS"
-            if save:
-                self.TS_path = self.validate_path(save_path, save_postfix)
-                print("{} saving calibrated TS to {}".format(dt.datetime.now().strftime('%H:%M:%S'), self.TS_path))
-                self.TS.to_netcdf(path=self.TS_path, mode="w")
+            if cache_path is not None:
+                self.TS.to_netcdf(path=cache_path, mode="w")
+        if save:
+            self.TS_path = self.validate_path(save_path, save_postfix)
+            print("{} saving calibrated TS to {}".format(dt.datetime.now().strftime('%H:%M:%S'), self.TS_path))
+            self.TS.to_netcdf(path=self.TS_path, mode="w")
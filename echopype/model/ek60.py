@@ -5,7 +5,6 @@ echopype data model inherited from based class EchoData for EK60 data.
 import os
 import datetime as dt
 import numpy as np
-import xarray as xr
 from .modelbase import ModelBase
 from echopype.utils import uwa
 
@@ -19,15 +18,14 @@ class ModelEK60(ModelBase):
 
         # Initialize environment-related parameters
         self._sound_speed = self.calc_sound_speed()
-        self._sample_thickness = self.calc_sample_thickness()
         self._range = self.calc_range()
         self._seawater_absorption = self.calc_seawater_absorption()
 
-        # Initialize calibration-related parameters
-        with xr.open_dataset(self.file_path, group="Beam") as ds_beam:
-            self._gain_correction = ds_beam.gain_correction
-            self._equivalent_beam_angle = ds_beam.equivalent_beam_angle
-            self._sa_correction = ds_beam.sa_correction
+        # Initialize calibration-related parameters, copied so that setters do not modify the opened file data
+        ds_beam = self._open_group('Beam')
+        self._gain_correction = ds_beam.gain_correction.load().copy()
+        self._equivalent_beam_angle = ds_beam.equivalent_beam_angle.load().copy()
+        self._sa_correction = ds_beam.sa_correction.load().copy()
 
     # EK60 calibration parameters
     @property
@@ -57,8 +55,7 @@ class ModelEK60(ModelBase):
     # Environmental and derived parameters
     def calc_sound_speed(self, src='file'):
         if src == 'file':
-            with xr.open_dataset(self.file_path, group="Environment") as ds_env:
-                return ds_env.sound_speed_indicative
+            return self._open_group('Environment').sound_speed_indicative.load().copy()
         elif src == 'user':
             ss = uwa.calc_sound_speed(salinity=self.salinity,
                                       temperature=self.temperature,
@@ -71,11 +68,9 @@ class ModelEK60(ModelBase):
         """Returns the seawater absorption values from the .nc file.
         """
         if src == 'file':
-            with xr.open_dataset(self.file_path, group="Environment") as ds_env:
-                return ds_env.absorption_indicative
+            return self._open_group('Environment').absorption_indicative.load().copy()
         elif src == 'user':
-            with xr.open_dataset(self.file_path, group='Beam') as ds_beam:
-                freq = ds_beam.frequency.astype(np.int64)  # should already be in unit [Hz]
+            freq = self._open_group('Beam').frequency.astype(np.int64)  # should already be in unit [Hz]
             return uwa.calc_seawater_absorption(freq,
                                                 temperature=self.temperature,
                                                 salinity=self.salinity,
@@ -85,18 +80,14 @@ class ModelEK60(ModelBase):
             ValueError('Not sure how to update seawater absorption!')
 
     def calc_sample_thickness(self):
-        with xr.open_dataset(self.file_path, group="Beam") as ds_beam:
-            sth = self.sound_speed * ds_beam.sample_interval / 2  # sample thickness
-            return sth
+        return self.sound_speed * self._open_group('Beam').sample_interval / 2  # sample thickness
 
     def calc_range(self):
         """Calculates range in meters using parameters stored in the .nc file.
         """
-        with xr.open_dataset(self.file_path, group="Beam") as ds_beam:
-            range_meter = ds_beam.range_bin * self.sample_thickness - \
-                        self.tvg_correction_factor * self.sample_thickness  # DataArray [frequency x range_bin]
-            range_meter = range_meter.where(range_meter > 0, other=0)
-            return range_meter
+        range_meter = self._open_group('Beam').range_bin * self.sample_thickness - \
+            self.tvg_correction_factor * self.sample_thickness  # DataArray [frequency x range_bin]
+        return range_meter.clip(min=0)
 
     def calibrate(self, save=False, save_postfix='_Sv', save_path=None):
         """Perform echo-integration to get volume backscattering strength (Sv) from EK60 power data.
@@ -114,33 +105,28 @@ class ModelEK60(ModelBase):
         # Print raw data nc file
         print('%s  calibrating data in %s' % (dt.datetime.now().strftime('%H:%M:%S'), self.file_path))
 
-        # Open data set for Environment and Beam groups
-        ds_beam = xr.open_dataset(self.file_path, group="Beam")
+        ds_beam = self._open_group('Beam')
 
-        # Derived params
-        wavelength = self.sound_speed / ds_beam.frequency  # wavelength
-
-        # Get backscatter_r and range_bin
-        backscatter_r = ds_beam['backscatter_r']
+        # Derived params, all per frequency
+        sound_speed = np.asarray(self.sound_speed)
+        wavelength = sound_speed / ds_beam.frequency.values  # wavelength
 
         # Calc gain
-        CSv = 10 * np.log10((ds_beam.transmit_power * (10 ** (self.gain_correction / 10)) ** 2 *
-                             wavelength ** 2 * self.sound_speed * ds_beam.transmit_duration_nominal *
-                             10 ** (self.equivalent_beam_angle / 10)) /
+        CSv = 10 * np.log10((ds_beam.transmit_power.values * (10 ** (self.gain_correction.values / 10)) ** 2 *
+                             wavelength ** 2 * sound_speed * ds_beam.transmit_duration_nominal.values *
+                             10 ** (self.equivalent_beam_angle.values / 10)) /
                             (32 * np.pi ** 2))
 
-        # Get TVG and absorption
-        range_meter = self.range
-        TVG = np.real(20 * np.log10(range_meter.where(range_meter >= 1, other=1)))
-        ABS = 2 * self.seawater_absorption * range_meter
-
         # Calibration and echo integration
-        Sv = backscatter_r + TVG + ABS - CSv - 2 * self.sa_correction
+        range_meter = self.range
+        Sv = self._calc_echo_level(ds_beam.backscatter_r.transpose('frequency', 'ping_time', 'range_bin'),
+                                   range_meter.transpose('frequency', 'range_bin').values, tvg_factor=20,
+                                   freq_term=-CSv - 2 * self.sa_correction.values, tvg_min_range=1)
         Sv.name = 'Sv'
         Sv = Sv.to_dataset()
 
         # Attach calculated range into data set
-        Sv['range'] = (('frequency', 'range_bin'), self.range.T)
+        Sv['range'] = (('frequency', 'range_bin'), range_meter.T)
 
         # Save calibrated data into the calling instance and
         #  to a separate .nc file in the same directory as the data filef.Sv = Sv
@@ -150,9 +136,6 @@ class ModelEK60(ModelBase):
             print('%s  saving calibrated Sv to %s' % (dt.datetime.now().strftime('%H:%M:%S'), self.Sv_path))
             Sv.to_netcdf(path=self.Sv_path, mode="w")
 
-        # Close opened resources
-        ds_beam.close()
-
     def calibrate_TS(self, save=False, save_postfix='_TS', save_path=None):
         """Perform echo-integration to get Target Strength (TS) from EK60 power data.
 
@@ -167,31 +150,25 @@ class ModelEK60(ModelBase):
             Full filename to save the TS calculation results, overwritting the RAWFILE_TS.nc default
         """
 
-        # Open data set for Environment and Beam groups
-        ds_env = xr.open_dataset(self.file_path, group="Environment")
-        ds_beam = xr.open_dataset(self.file_path, group="Beam")
-        # Derived params
-        wavelength = self.sound_speed / ds_env.frequency  # wavelength
+        ds_beam = self._open_group('Beam')
+        # Derived params, all per frequency
+        wavelength = np.asarray(self.sound_speed) / ds_beam.frequency.values  # wavelength
 
-        # Get backscatter_r and range_bin
-        backscatter_r = ds_beam['backscatter_r']
         # Calc gain
-        CSp = 10 * np.log10((ds_beam.transmit_power * (10 ** (ds_beam.gain_correction / 10)) ** 2 *
+        CSp = 10 * np.log10((ds_beam.transmit_power.values * (10 ** (ds_beam.gain_correction.values / 10)) ** 2 *
                              wavelength ** 2) /
                             (16 * np.pi ** 2))
 
-        # Get TVG and absorption
-        range_meter = self.range
-        TVG = np.real(40 * np.log10(range_meter.where(range_meter >= 1, other=1)))
-        ABS = 2 * self.seawater_absorption * range_meter
-
         # Calibration and echo integration
-        TS = backscatter_r + TVG + ABS - CSp
+        range_meter = self.range
+        TS = self._calc_echo_level(ds_beam.backscatter_r.transpose('frequency', 'ping_time', 'range_bin'),
+                                   range_meter.transpose('frequency', 'range_bin').values, tvg_factor=40,
+                                   freq_term=-CSp, tvg_min_range=1)
         TS.name = 'TS'
         TS = TS.to_dataset()
 
         # Attach calculated range into data set
-        TS['range'] = (('frequency', 'range_bin'), self.range.T)
+        TS['range'] = (('frequency', 'range_bin'), range_meter.T)
 
         # Save calibrated data into the calling instance and
         #  to a separate .nc file in the same directory as the data filef.Sv = Sv
@@ -200,7 +177,3 @@ class ModelEK60(ModelBase):
             self.TS_path = self.validate_path(save_path, save_postfix)
             print('%s  saving calibrated TS to %s' % (dt.datetime.now().strftime('%H:%M:%S'), self.TS_path))
             TS.to_netcdf(path=self.TS_path, mode="w")
-
-        # Close opened resources
-        ds_env.close()
-        ds_beam.close()
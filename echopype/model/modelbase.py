@@ -4,6 +4,7 @@ its connection to data files.
 """
 
 import os
+import hashlib
 import warnings
 import datetime as dt
 from echopype.utils import uwa
@@ -16,6 +17,7 @@ class ModelBase(object):
     """Class for manipulating echo data that is already converted to netCDF."""
 
     def __init__(self, file_path=""):
+        self._ds_cache = {}       # netCDF groups opened from file_path, keyed by group name
         self.file_path = file_path  # this passes the input through file name test
         self.noise_est_range_bin_size = 5  # meters per tile for noise estimation
         self.noise_est_ping_size = 30  # number of pings per tile for noise estimation
@@ -61,6 +63,8 @@ class ModelBase(object):
 
     @property
     def sample_thickness(self):
+        if self._sample_thickness is None:  # calculate on first access
+            self._sample_thickness = self.calc_sample_thickness()
         return self._sample_thickness
 
     @sample_thickness.setter
@@ -100,6 +104,7 @@ class ModelBase(object):
 
     @file_path.setter
     def file_path(self, p):
+        self.close()  # groups opened from a previous file are no longer valid
         self._file_path = p
 
         # Load netCDF groups if file format is correct
@@ -128,6 +133,38 @@ class ModelBase(object):
         else:
             raise ValueError('Data file format not recognized.')
 
+    def _open_group(self, group):
+        """Opens a group of the converted .nc file, reusing the dataset if it is already open.
+
+        Variables are read from disk on each access rather than kept in memory (``cache=False``),
+        so large arrays such as backscatter_r are not held for the lifetime of the model.
+
+        Parameters
+        ----------
+        group : str
+            name of the netCDF group, e.g. 'Beam', 'Vendor' or 'Environment'
+
+        Returns
+        -------
+        An xarray Dataset of the group
+        """
+        if group not in self._ds_cache:
+            self._ds_cache[group] = xr.open_dataset(self.file_path, group=group, cache=False)
+        return self._ds_cache[group]
+
+    def close(self):
+        """Closes the netCDF groups opened by this instance.
+        """
+        for ds in self._ds_cache.values():
+            ds.close()
+        self._ds_cache = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def calc_sound_speed(self, src='file'):
         """Base method to be overridden for calculating sound_speed for different sonar models
         """
@@ -228,6 +265,70 @@ class ModelBase(object):
 
         return os.path.join(save_dir, file_out)
 
+    def _calc_echo_level(self, backscatter_r, range_meter, tvg_factor, freq_term,
+                         scale=None, tvg_min_range=None, dtype='float64'):
+        """Calculates calibrated echo level from backscatter data, shared by Sv and TS of all sonar models.
+
+        Terms that only vary with frequency, and with frequency and range_bin, are combined
+        on plain arrays before a single broadcast add to the backscatter data, so that the
+        output is the only array allocated with the full data dimensions.
+
+        Parameters
+        ----------
+        backscatter_r : xr.DataArray
+            backscatter data with dimensions [frequency x ping_time x range_bin]
+        range_meter : np.ndarray
+            range in meters with dimensions [frequency x range_bin]
+        tvg_factor : int
+            multiplier of log10(range) in the time-varied gain, 20 for Sv and 40 for TS
+        freq_term : np.ndarray
+            sum of calibration terms that vary only with frequency
+        scale : np.ndarray, optional
+            per-frequency divisor applied to backscatter_r before the other terms are added
+        tvg_min_range : num, optional
+            lower bound of the range used in the time-varied gain
+        dtype : str or np.dtype
+            data type of the output array, defaults to 'float64'
+
+        Returns
+        -------
+        An xarray DataArray with the dimensions and coordinates of backscatter_r
+        """
+        tvg_range = range_meter if tvg_min_range is None else range_meter.clip(min=tvg_min_range)
+        range_term = np.log10(tvg_range)   # time-varied gain and absorption, built in place
+        range_term *= tvg_factor
+        range_term += 2 * np.asarray(self.seawater_absorption)[:, np.newaxis] * range_meter
+        range_term += freq_term[:, np.newaxis]
+
+        if scale is None:
+            echo_level = np.add(backscatter_r.values, range_term[:, np.newaxis, :], dtype=dtype)
+        else:
+            echo_level = np.divide(backscatter_r.values, scale[:, np.newaxis, np.newaxis], dtype=dtype)
+            echo_level += range_term[:, np.newaxis, :]
+        return xr.DataArray(echo_level, coords=backscatter_r.coords, dims=backscatter_r.dims)
+
+    def _get_cache_path(self, save_postfix, *params):
+        """Returns the path of the on-disk cache of a calibration result.
+
+        The cache filename is keyed on the modification time and size of the .nc file
+        and on the values of ``params``, so changing either leads to a different cache file.
+
+        Parameters
+        ----------
+        save_postfix : str
+            postfix of the calibration result, e.g. '_Sv' or '_TS'
+        params
+            scalars or arrays that the calibration result depends on
+        """
+        file_stat = os.stat(self.file_path)
+        key = hashlib.blake2b(digest_size=8)
+        key.update(np.array([file_stat.st_mtime_ns, file_stat.st_size]).tobytes())
+        for p in params:
+            key.update(np.asarray(p).tobytes())
+        file_name = os.path.splitext(os.path.basename(self.file_path))[0]
+        return os.path.join(os.path.dirname(self.file_path),
+                            file_name + save_postfix + '.cache.' + key.hexdigest() + '.nc')
+
     @staticmethod
     def get_tile_params(r_data_sz, p_data_sz, r_tile_sz, p_tile_sz, sample_thickness):
         """Obtain ping_time and range_bin parameters associated with groupby and groupby_bins operations.
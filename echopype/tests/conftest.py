@@ -0,0 +1,25 @@
+import os
+import pytest
+from echopype.convert import Convert
+
+ek60_raw_path = './echopype/test_data/ek60/DY1801_EK60-D20180211-T164025.raw'     # Standard test
+azfp_01a_path = './echopype/test_data/azfp/17082117.01A'     # Standard test
+azfp_xml_path = './echopype/test_data/azfp/17041823.XML'     # Standard test
+
+
+@pytest.fixture(scope='session')
+def ek60_converted():
+    """Convert the standard EK60 test file to .nc once and share it between test modules."""
+    tmp = Convert(ek60_raw_path)
+    tmp.raw2nc()
+    yield tmp
+    os.remove(tmp.nc_path)
+
+
+@pytest.fixture(scope='session')
+def azfp_converted():
+    """Convert the standard AZFP test file to .nc once and share it between test modules."""
+    tmp = Convert(azfp_01a_path, azfp_xml_path)
+    tmp.raw2nc()
+    yield tmp
+    os.remove(tmp.nc_path)
@@ -1,26 +1,20 @@
 import os
 import numpy as np
 import xarray as xr
-from echopype.convert import Convert
 from echopype.model import EchoData
 
-azfp_xml_path = './echopype/test_data/azfp/17041823.XML'
-azfp_01a_path = './echopype/test_data/azfp/17082117.01A'
 azfp_test_Sv_path = './echopype/test_data/azfp/from_matlab/17082117_Sv.nc'
 azfp_test_TS_path = './echopype/test_data/azfp/from_matlab/17082117_TS.nc'
 azfp_test_path = './echopype/test_data/azfp/from_matlab/17082117.nc'
 
 
-def test_model_AZFP():
+def test_model_AZFP(azfp_converted):
     # Read in the dataset that will be used to confirm working conversions. Generated from MATLAB code.
     Sv_test = xr.open_dataset(azfp_test_Sv_path)
     TS_test = xr.open_dataset(azfp_test_TS_path)
 
-    # Convert to .nc file
-    tmp_convert = Convert(azfp_01a_path, azfp_xml_path)
-    tmp_convert.raw2nc()
-
-    tmp_echo = EchoData(tmp_convert.nc_path)
+    # .nc file is converted once per session by the azfp_converted fixture
+    tmp_echo = EchoData(azfp_converted.nc_path)
     tmp_echo.calibrate(save=True)
     tmp_echo.calibrate_TS(save=True)
     tmp_echo.get_MVBS()
@@ -37,10 +31,40 @@ def test_model_AZFP():
     with xr.open_dataset(tmp_echo.TS_path) as ds_TS:
         assert np.allclose(TS_test.TS, ds_TS.TS, atol=1e-15)
 
+    # Test float32 output, which should match float64 output to float32 precision
+    tmp_echo.calibrate(dtype='float32')
+    tmp_echo.calibrate_TS(dtype='float32')
+    Sv_32, TS_32 = tmp_echo.Sv.Sv, tmp_echo.TS
+    assert Sv_32.dtype == np.float32 and TS_32.dtype == np.float32
+    tmp_echo.calibrate()
+    tmp_echo.calibrate_TS()
+    assert np.allclose(Sv_32, tmp_echo.Sv.Sv, rtol=0, atol=1e-4)
+    assert np.allclose(TS_32, tmp_echo.TS, rtol=0, atol=1e-4)
+
+    # Test on-disk cache: the first calls write the cache and later calls must load it
+    tmp_echo.calibrate(use_cache=True)
+    tmp_echo.calibrate_TS(use_cache=True)
+    Sv_computed, TS_computed = tmp_echo.Sv, tmp_echo.TS
+    cache_paths = [tmp_echo._get_cache_path('_Sv', tmp_echo.sound_speed, tmp_echo.seawater_absorption,
+                                            tmp_echo.range, np.dtype('float64').str),
+                   tmp_echo._get_cache_path('_TS', tmp_echo.seawater_absorption,
+                                            tmp_echo.range, np.dtype('float64').str)]
+    assert all(os.path.exists(p) for p in cache_paths)
+
+    def _no_recompute(*args, **kwargs):
+        raise AssertionError('calibration was recomputed instead of loaded from the cache')
+    tmp_echo._calc_echo_level = _no_recompute
+    tmp_echo.calibrate(use_cache=True)
+    tmp_echo.calibrate_TS(use_cache=True)
+    del tmp_echo._calc_echo_level
+    assert np.array_equal(Sv_computed.Sv, tmp_echo.Sv.Sv)
+    assert np.array_equal(TS_computed, tmp_echo.TS)
+    for p in cache_paths:
+        os.remove(p)
+
     Sv_test.close()
     TS_test.close()
+    tmp_echo.close()
     os.remove(tmp_echo.Sv_path)
     os.remove(tmp_echo.TS_path)
-    os.remove(tmp_convert.nc_path)
-    del tmp_convert
     del tmp_echo
@@ -1,10 +1,9 @@
-import os
 import shutil
 import numpy as np
 import xarray as xr
 from echopype.convert import Convert
 
-ek60_raw_path = './echopype/test_data/ek60/DY1801_EK60-D20180211-T164025.raw'     # Standard test
+# Standard EK60 and AZFP test files are converted by fixtures in conftest.py
 # ek60_raw_path = './echopype/test_data/ek60/2015843-D20151023-T190636.raw'     # Different ranges
 # ek60_raw_path = ['./echopype/test_data/ek60/OOI-D20170821-T063618.raw',
 #                  './echopype/test_data/ek60/OOI-D20170821-T081522.raw']       # Multiple files
@@ -15,32 +14,26 @@ ek60_raw_path = './echopype/test_data/ek60/DY1801_EK60-D20180211-T164025.raw'
 
 # azfp_01a_path = './echopype/data/azfp/17031001.01A'     # Canada (Different ranges)
 # azfp_xml_path = './echopype/data/azfp/17030815.XML'     # Canada (Different ranges)
-azfp_01a_path = './echopype/test_data/azfp/17082117.01A'     # Standard test
-azfp_xml_path = './echopype/test_data/azfp/17041823.XML'     # Standard test
 azfp_test_path = './echopype/test_data/azfp/from_matlab/17082117.nc'
 # azfp_01a_path = ['./echopype/test_data/azfp/17033000.01A',     # Multiple files
 #                  './echopype/test_data/azfp/17033001.01A']
 # azfp_xml_path = './echopype/test_data/azfp/17033000.XML'       # Multiple files
 
 
-def test_convert_ek60():
+def test_convert_ek60(ek60_converted):
     """Test converting """
     # Unpacking data
     # tmp = ConvertEK60(ek60_raw_path)
     # tmp.load_ek60_raw()
 
-    # # Convert to .nc file
-    # tmp.raw2nc()
-    tmp = Convert(ek60_raw_path)
+    # .nc file is converted once per session by the ek60_converted fixture
+    tmp = ek60_converted
 
-    # Test saving zarr file
+    # Test saving zarr file, reusing data already parsed for the .nc file
     tmp.raw2zarr()
     shutil.rmtree(tmp.zarr_path, ignore_errors=True)  # delete non-empty folder
                                                       # consider alternative using os.walk() if have os-specific errors
 
-    # Test saving nc file and perform checks
-    tmp.raw2nc()
-
     # Read .nc file into an xarray DataArray
     ds_beam = xr.open_dataset(tmp.nc_path, group='Beam')
 
@@ -50,27 +43,43 @@ def test_convert_ek60():
         assert np.any(tmp.power_dict_split[0][idx-1, :, :] ==  # idx-1 because power_dict_split[0] has a numpy array
                       ds_beam.backscatter_r.sel(frequency=tmp.config_datagram['transceivers'][idx]['frequency']).data)
     ds_beam.close()
-    os.remove(tmp.nc_path)
-    del tmp
 
 
-def test_convert_AZFP():
+def test_convert_ek60_multiple_files(ek60_converted, tmp_path):
+    """Test converting multiple files without combining, serially and in parallel"""
+    # The same raw file copied under two names is converted into two separate .nc files
+    raw_paths = [str(tmp_path / ('copy%d-D20180211-T164025.raw' % ii)) for ii in range(2)]
+    for raw_path in raw_paths:
+        shutil.copyfile(ek60_converted.filename[0], raw_path)
+
+    tmp_serial = Convert(raw_paths)
+    tmp_serial.raw2nc()
+    tmp_parallel = Convert(raw_paths)
+    tmp_parallel.raw2nc(save_path=str(tmp_path / 'parallel'), parallel=True)
+
+    with xr.open_dataset(ek60_converted.nc_path, group='Beam') as ds_beam:
+        for serial_path, parallel_path in zip(tmp_serial.nc_path, tmp_parallel.nc_path):
+            with xr.open_dataset(serial_path, group='Beam') as ds_serial, \
+                    xr.open_dataset(parallel_path, group='Beam') as ds_parallel:
+                assert np.array_equal(ds_beam.backscatter_r, ds_serial.backscatter_r)
+                assert np.array_equal(ds_beam.backscatter_r, ds_parallel.backscatter_r)
+
+
+def test_convert_AZFP(azfp_converted):
     # Read in the dataset that will be used to confirm working conversions. Generated from MATLAB code
     ds_test = xr.open_dataset(azfp_test_path)
 
     # Unpacking data
     # tmp = ConvertAZFP(azfp_01a_path, azfp_xml_path)
     # tmp.parse_raw()
-    tmp = Convert(azfp_01a_path, azfp_xml_path)
+    # .nc file is converted once per session by the azfp_converted fixture
+    tmp = azfp_converted
 
-    # Test saving zarr file
+    # Test saving zarr file, reusing data already parsed for the .nc file
     tmp.raw2zarr()
     shutil.rmtree(tmp.zarr_path, ignore_errors=True)
 
-    # Test saving nc file and perform checks
-    tmp.raw2nc()
-
-    # Test beam group
+    # Test beam group of the nc file
     with xr.open_dataset(tmp.nc_path, group='Beam') as ds_beam:
         # Test frequency
         assert np.array_equal(ds_test.frequency, ds_beam.frequency)
@@ -97,5 +106,3 @@ def test_convert_AZFP():
     #     assert np.array_equal(ds_test.battery_tx, ds_vend.battery_tx)
 
     ds_test.close()
-    os.remove(tmp.nc_path)
-    del tmp
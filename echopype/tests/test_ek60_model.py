@@ -1,29 +1,22 @@
 import os
 import numpy as np
 import xarray as xr
-from echopype.convert import Convert
 from echopype.model import EchoData
 
 # ek60_raw_path = './echopype/test_data/ek60/2015843-D20151023-T190636.raw'   # Varying ranges
 ek60_raw_path = './echopype/test_data/ek60/DY1801_EK60-D20180211-T164025.raw'     # Constant ranges
 ek60_test_path = './echopype/test_data/ek60/from_matlab/DY1801_EK60-D20180211-T164025_Sv_TS.nc'
-nc_path = os.path.join(os.path.dirname(ek60_raw_path),
-                       os.path.splitext(os.path.basename(ek60_raw_path))[0] + '.nc')
 Sv_path = os.path.join(os.path.dirname(ek60_raw_path),
                        os.path.splitext(os.path.basename(ek60_raw_path))[0] + '_Sv.nc')
 
 
-def test_noise_estimates_removal():
+def test_noise_estimates_removal(ek60_converted):
     """Check noise estimation and noise removal using xarray and brute force using numpy.
     """
 
     # Noise estimation via EchoData method =========
-    # Unpack data and convert to .nc file
-    tmp = Convert(ek60_raw_path)
-    tmp.raw2nc()
-
-    # Read .nc file into an EchoData object and calibrate
-    e_data = EchoData(nc_path)
+    # Read .nc file converted by the ek60_converted fixture into an EchoData object and calibrate
+    e_data = EchoData(ek60_converted.nc_path)
     e_data.calibrate(save=True)
     noise_est = e_data.noise_estimates()
 
@@ -101,7 +94,29 @@ def test_noise_estimates_removal():
                    != Sv_clean_test[~np.isnan(Sv_clean_test)])
 
     proc_data.close()
-    del tmp
+    e_data.close()
     del e_data
-    os.remove(nc_path)
     os.remove(Sv_path)
+
+
+def test_set_params_keep_file_values(ek60_converted):
+    """Check that setting parameters does not change the values read from the .nc file.
+    """
+    e_data = EchoData(ek60_converted.nc_path)
+    e_data.calibrate_TS()
+    TS_file = e_data.TS.TS.values
+    sound_speed_file = e_data.calc_sound_speed().values
+    absorption_file = e_data.calc_seawater_absorption().values
+
+    # calibrate_TS uses gain_correction from the file
+    e_data.gain_correction = np.zeros(e_data.gain_correction.shape)
+    e_data.calibrate_TS()
+    assert np.array_equal(TS_file, e_data.TS.TS.values)
+
+    e_data.sound_speed = np.full(sound_speed_file.shape, 1500.)
+    e_data.seawater_absorption = np.full(absorption_file.shape, 0.01)
+    assert np.array_equal(sound_speed_file, e_data.calc_sound_speed(src='file').values)
+    assert np.array_equal(absorption_file, e_data.calc_seawater_absorption(src='file').values)
+
+    e_data.close()
+    del e_data